@@ -1,35 +1,110 @@
 import os, json, re
+from concurrent.futures import ThreadPoolExecutor
 
 PLUGIN_DIR = "plugins"
 ICON_DIR = "icons"
 OUTPUT_FILE = "plugins.json"
+CACHE_FILE = "plugins.cache.json"
+CACHE_VERSION = 1  # Bump when scan() changes so cached metadata is rescanned
 RELEASE_BASE_URL = "https://github.com/AidenZaire/algebytestore/releases/latest/download"
 
+# Metadata lives at the top of each plugin, so only the file header is scanned
+HEADER_SIZE = 8192
+METADATA_KEYS = ("name", "author", "version", "description")
+
 metadata_pattern = re.compile(r'__plugin_(name|author|version|description)__\s*=\s*["\'](.+?)["\']')
 
-plugins_data = []
-
-for filename in os.listdir(PLUGIN_DIR):
-    if filename.endswith(".py"):
-        plugin_path = os.path.join(PLUGIN_DIR, filename)
-        with open(plugin_path, "r", encoding="utf-8") as f:
-            content = f.read()
-
-        meta_matches = dict(re.findall(metadata_pattern, content))
-
-        if all(k in meta_matches for k in ["name", "author", "version", "description"]):
-            icon_file = filename.replace(".py", ".png")
-            icon_url = f"{RELEASE_BASE_URL}/{icon_file}"
-            download_url = f"{RELEASE_BASE_URL}/{filename}"
-
-            plugins_data.append({
-                "name": meta_matches["name"],
-                "author": meta_matches["author"],
-                "version": meta_matches["version"],
-                "description": meta_matches["description"],
-                "icon_url": icon_url,
-                "download_url": download_url
-            })
+
+def scan(entry):
+    """Return the parsed metadata for a plugin file, or None if it has no metadata."""
+    with open(entry.path, "rb") as f:
+        head = f.read(HEADER_SIZE) + f.readline()  # Don't cut a metadata line in half
+    if b"__plugin_" not in head:
+        return None
+
+    meta_matches = {}
+    for m in metadata_pattern.finditer(head.decode("utf-8", errors="ignore")):
+        meta_matches[m.group(1)] = m.group(2)
+        if len(meta_matches) == len(METADATA_KEYS):
+            break
+
+    if not all(k in meta_matches for k in METADATA_KEYS):
+        return None
+    return meta_matches
+
+
+def build_record(filename, meta_matches):
+    icon_file = filename.replace(".py", ".png")
+    icon_url = f"{RELEASE_BASE_URL}/{icon_file}"
+    download_url = f"{RELEASE_BASE_URL}/{filename}"
+
+    return {
+        "name": meta_matches["name"],
+        "author": meta_matches["author"],
+        "version": meta_matches["version"],
+        "description": meta_matches["description"],
+        "icon_url": icon_url,
+        "download_url": download_url
+    }
+
+
+def load_cache():
+    try:
+        with open(CACHE_FILE, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        if data.get("version") == CACHE_VERSION:
+            return data["files"]
+    except (OSError, ValueError, AttributeError, KeyError):
+        pass
+    return {}
+
+
+def save_cache(cache):
+    tmp_path = CACHE_FILE + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump({"version": CACHE_VERSION, "files": cache}, f)
+    os.replace(tmp_path, CACHE_FILE)
+
+
+with os.scandir(PLUGIN_DIR) as it:
+    entries = sorted(
+        (e for e in it if e.is_file() and e.name.endswith(".py")),
+        key=lambda e: e.name
+    )
+
+# Only rescan files whose mtime/size changed since the last run. The cache holds
+# parsed metadata only; output records (URLs included) are rebuilt every run.
+cache = load_cache()
+results = {}
+stale = []
+for entry in entries:
+    st = entry.stat()
+    cached = cache.get(entry.name)
+    if cached and cached["mtime_ns"] == st.st_mtime_ns and cached["size"] == st.st_size:
+        results[entry.name] = cached["meta"]
+    else:
+        stale.append(entry)
+
+# Scanning is I/O-bound, so overlap the reads
+if stale:
+    with ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 4)) as ex:
+        for entry, meta in zip(stale, ex.map(scan, stale)):
+            results[entry.name] = meta
+
+new_cache = {}
+for entry in entries:
+    st = entry.stat()
+    new_cache[entry.name] = {
+        "mtime_ns": st.st_mtime_ns,
+        "size": st.st_size,
+        "meta": results[entry.name]
+    }
+save_cache(new_cache)
+
+plugins_data = [
+    build_record(entry.name, results[entry.name])
+    for entry in entries if results[entry.name]
+]
 
 with open(OUTPUT_FILE, "w", encoding="utf-8") as f:
     json.dump(plugins_data, f, indent=2)
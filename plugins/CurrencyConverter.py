@@ -3,12 +3,14 @@ from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit, QPushButton,
     QComboBox, QGroupBox, QFormLayout
 )
-from PySide6.QtCore import Qt, Signal
+from PySide6.QtCore import Qt, Signal, QObject, QRunnable, QThreadPool, QTimer, QLocale
 from PySide6.QtGui import QDoubleValidator
 import requests
+from requests.adapters import HTTPAdapter
 import json
 import importlib
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 
 from core.plugin_interface import PluginWidget
 
@@ -29,11 +31,77 @@ DARK_HOVER = "#2A2A2A"
 DARK_INPUT = "#2D2D2D"
 DARK_DANGER = "#CF6679"
 
+# Stylesheets are static, so build them once at import
+_GROUPBOX_QSS = f"""
+    QGroupBox {{
+        background-color: {DARK_CARD};
+        color: {DARK_TEXT};
+        border: 1px solid {DARK_DIVIDER};
+        border-radius: 6px;
+        margin-top: 6px;
+    }}
+    QGroupBox:title {{
+        subcontrol-origin: margin;
+        subcontrol-position: top left;
+        padding: 0 3px;
+    }}
+"""
+
+_INPUT_QSS = f"""
+    QLineEdit, QComboBox {{
+        background-color: {DARK_INPUT};
+        color: {DARK_TEXT};
+        border: 1px solid {DARK_DIVIDER};
+        border-radius: 4px;
+        padding: 4px;
+    }}
+"""
+
+@lru_cache(maxsize=None)
+def _button_qss(color):
+    return f"""
+        QPushButton {{
+            background-color: {color};
+            color: {DARK_TEXT};
+            border-radius: 6px;
+            padding: 6px 12px;
+        }}
+        QPushButton:hover {{
+            background-color: {DARK_HOVER};
+        }}
+    """
+
 API_URL = "https://open.er-api.com/v6/latest/{}"  # Base currency placeholder
+RATES_BASE = "USD"  # Rates are stored against one base; cross-rates are derived locally
+RATES_TTL = timedelta(hours=24)  # Cached rates younger than this skip the network
+
+# Shared session so repeated fetches reuse the keep-alive TLS connection
+_SESSION = requests.Session()
+_SESSION.headers.update({"User-Agent": f"Algebyte/{__plugin_version__}"})
+_SESSION.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=4))
 
 # Indirect os import to bypass restrictions
 os_module = importlib.import_module("os")
 
+class RatesFetcherSignals(QObject):
+    finished = Signal(dict)
+    failed = Signal(str)
+
+class RatesFetcher(QRunnable):
+    """Fetch the rate table on a pool thread so the UI thread never blocks on the network."""
+
+    def __init__(self, url):
+        super().__init__()
+        self.url = url
+        self.signals = RatesFetcherSignals()
+
+    def run(self):
+        try:
+            resp = _SESSION.get(self.url, timeout=10)
+            self.signals.finished.emit(resp.json())
+        except Exception as e:
+            self.signals.failed.emit(str(e))
+
 class PluginWidget(PluginWidget):
     back_to_manager = Signal()  # Signal to return to plugin manager
     
@@ -41,8 +109,16 @@ class PluginWidget(PluginWidget):
         super().__init__(parent)
         self.rates = {}
         self.currencies = []
+        self._shown_currencies = ()  # Currency set currently in the combo boxes
         self.offline_file = os_module.path.join(os_module.path.dirname(__file__), "money_rates.json")
         self.online_mode = True
+        self._fetched_at = None  # When self.rates was last fetched online
+        self._fetcher = None  # In-flight RatesFetcher, coalesces duplicate requests
+        # Coalesce rapid "From" changes (e.g. arrow-key navigation) into one update
+        self._base_change_timer = QTimer(self)
+        self._base_change_timer.setSingleShot(True)
+        self._base_change_timer.setInterval(300)
+        self._base_change_timer.timeout.connect(self.apply_base_currency_change)
         self.setMinimumSize(500, 400)
         self.setup_ui()
         self.load_rates_offline()
@@ -56,7 +132,7 @@ class PluginWidget(PluginWidget):
 
         # Toolbar
         toolbar = QHBoxLayout()
-        refresh_btn = self.make_button("🔄 Refresh Rates", DARK_ACCENT, self.fetch_rates_online)
+        refresh_btn = self.make_button("🔄 Refresh Rates", DARK_ACCENT, lambda: self.fetch_rates_online(force=True))
         mode_btn = self.make_button("🌐 Switch to Offline", DARK_ACCENT_SECONDARY, self.toggle_mode)
         back_btn = self.make_button("← Back", DARK_ACCENT_SECONDARY, self.go_back)
         toolbar.addWidget(back_btn)
@@ -101,26 +177,74 @@ class PluginWidget(PluginWidget):
         main_layout.addStretch()
 
     # ---------------------- Logic ----------------------
-    def fetch_rates_online(self):
-        try:
-            base_currency = self.from_currency.currentText() if self.from_currency.count() > 0 else "USD"
-            resp = requests.get(API_URL.format(base_currency), timeout=10)
-            data = resp.json()
+    def fetch_rates_online(self, force=False):
+        if not force:
+            rates = self.cached_rates()
+            if rates is not None:
+                self.apply_rates(rates, self.from_currency.currentText() or None)
+                self.show_message("Using cached exchange rates")
+                return
+
+        if self._fetcher is not None:
+            return  # A fetch is already running; its reply will update the UI
 
+        self._fetcher = RatesFetcher(API_URL.format(RATES_BASE))
+        self._fetcher.signals.finished.connect(self.on_rates_fetched)
+        self._fetcher.signals.failed.connect(self.on_rates_failed)
+        QThreadPool.globalInstance().start(self._fetcher)
+        self.show_message("Fetching exchange rates...")
+
+    def on_rates_fetched(self, data):
+        self._fetcher = None
+        try:
             if data.get("result") != "success":
                 raise ValueError(data.get("error-type", "Failed to fetch rates"))
 
-            self.rates = data["rates"]
-            self.rates[base_currency] = 1.0  # Ensure base currency rate is 1
-            self.currencies = sorted(self.rates.keys())
-            self.update_currency_lists(select_base=base_currency)
+            rates = data["rates"]
+            rates[RATES_BASE] = 1.0  # Ensure base currency rate is 1
+            self._fetched_at = datetime.now(timezone.utc)
+            self.apply_rates(rates, self.from_currency.currentText() or None)
             self.save_rates()
-            self.show_message(f"Exchange rates updated (Base: {base_currency})")
+            self.show_message("Exchange rates updated")
         except Exception as e:
-            self.show_message(f"Failed to fetch rates online: {str(e)}", error=True)
-            # Fallback to offline if online fails
-            if not self.rates:
-                self.load_rates_offline()
+            self.on_rates_failed(str(e))
+
+    def on_rates_failed(self, error):
+        self._fetcher = None
+        self.show_message(f"Failed to fetch rates online: {error}", error=True)
+        # Fallback to offline if online fails
+        if not self.rates:
+            self.load_rates_offline()
+
+    def cached_rates(self):
+        """Return RATES_BASE rates if fetched within RATES_TTL, else None."""
+        now = datetime.now(timezone.utc)
+        if self.rates and self._fetched_at and timedelta(0) <= now - self._fetched_at < RATES_TTL:
+            return self.rates
+
+        try:
+            with open(self.offline_file, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            fetched_at = datetime.fromisoformat(data["date"])
+            base = data["base"]
+            rates = data["rates"]
+        except (OSError, KeyError, TypeError, ValueError):
+            return None
+        if base != RATES_BASE or fetched_at.tzinfo is None:
+            return None
+        if not isinstance(rates, dict) or not rates:
+            return None
+        # A timestamp in the future (clock skew, hand edits) is treated as stale
+        if not timedelta(0) <= now - fetched_at < RATES_TTL:
+            return None
+
+        self._fetched_at = fetched_at
+        return rates
+
+    def apply_rates(self, rates, select_base=None):
+        self.rates = dict(rates)
+        self.currencies = sorted(self.rates)
+        self.update_currency_lists(select_base=select_base)
 
     def load_rates_offline(self):
         if os_module.path.exists(self.offline_file):
@@ -128,7 +252,7 @@ class PluginWidget(PluginWidget):
                 with open(self.offline_file, "r", encoding="utf-8") as f:
                     data = json.load(f)
                     self.rates = data["rates"]
-                    self.currencies = sorted(self.rates.keys())
+                    self.currencies = sorted(self.rates)
                     self.update_currency_lists()
                     self.show_message(f"Loaded offline rates (Last updated {data['date']})")
             except Exception as e:
@@ -138,13 +262,19 @@ class PluginWidget(PluginWidget):
         try:
             with open(self.offline_file, "w", encoding="utf-8") as f:
                 json.dump({
+                    "base": RATES_BASE,
                     "rates": self.rates,
-                    "date": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                }, f, indent=4)
+                    "date": datetime.now(timezone.utc).isoformat(timespec="seconds")
+                }, f, separators=(",", ":"))  # Machine-read only, so keep it compact
         except Exception as e:
             self.show_message(f"Error saving offline rates: {str(e)}", error=True)
 
     def update_currency_lists(self, select_base=None):
+        currencies = tuple(self.currencies)
+        if currencies == self._shown_currencies:
+            return  # Same set already shown; skip the repopulate and keep the user's selection
+        self._shown_currencies = currencies
+
         self.from_currency.blockSignals(True)
         self.to_currency.blockSignals(True)
 
@@ -165,8 +295,13 @@ class PluginWidget(PluginWidget):
         self.to_currency.blockSignals(False)
 
     def convert_currency(self):
+        # Parse with the same locale as the validator; returns (value, ok) instead of raising
+        amount, ok = QLocale().toDouble(self.amount_input.text())
+        if not ok:
+            self.show_message("Please enter a valid number.", error=True)
+            return
+
         try:
-            amount = float(self.amount_input.text())
             from_cur = self.from_currency.currentText()
             to_cur = self.to_currency.currentText()
             
@@ -177,8 +312,6 @@ class PluginWidget(PluginWidget):
             # Convert from base currency to target currency
             result = amount * (self.rates[to_cur] / self.rates[from_cur])
             self.result_label.setText(f"Result: {result:,.2f} {to_cur}")
-        except ValueError:
-            self.show_message("Please enter a valid number.", error=True)
         except Exception as e:
             self.show_message(f"Error converting currency: {str(e)}", error=True)
 
@@ -192,9 +325,15 @@ class PluginWidget(PluginWidget):
             self.load_rates_offline()
 
     def on_base_currency_change(self):
-        """Live update when base currency changes."""
-        if self.online_mode:
-            self.fetch_rates_online()
+        """Live update when base currency changes, debounced by _base_change_timer."""
+        self._base_change_timer.start()
+
+    def apply_base_currency_change(self):
+        """Rates are relative to RATES_BASE, so switching the base is a local
+        cross-rate lookup and never needs a network round-trip.
+        """
+        if self.amount_input.text():
+            self.convert_currency()
 
     # ---------------------- Helpers ----------------------
     def go_back(self):
@@ -202,46 +341,15 @@ class PluginWidget(PluginWidget):
 
     def make_button(self, text, color, slot):
         btn = QPushButton(text)
-        btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {color};
-                color: {DARK_TEXT};
-                border-radius: 6px;
-                padding: 6px 12px;
-            }}
-            QPushButton:hover {{
-                background-color: {DARK_HOVER};
-            }}
-        """)
+        btn.setStyleSheet(_button_qss(color))
         btn.clicked.connect(slot)
         return btn
 
     def groupbox_style(self):
-        return f"""
-            QGroupBox {{
-                background-color: {DARK_CARD};
-                color: {DARK_TEXT};
-                border: 1px solid {DARK_DIVIDER};
-                border-radius: 6px;
-                margin-top: 6px;
-            }}
-            QGroupBox:title {{
-                subcontrol-origin: margin;
-                subcontrol-position: top left;
-                padding: 0 3px;
-            }}
-        """
+        return _GROUPBOX_QSS
 
     def input_style(self):
-        return f"""
-            QLineEdit, QComboBox {{
-                background-color: {DARK_INPUT};
-                color: {DARK_TEXT};
-                border: 1px solid {DARK_DIVIDER};
-                border-radius: 4px;
-                padding: 4px;
-            }}
-        """
+        return _INPUT_QSS
 
     def show_message(self, text, error=False):
         color = DARK_DANGER if error else DARK_TEXT_SECONDARY
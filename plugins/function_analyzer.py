@@ -14,6 +14,7 @@ from matplotlib.backends.backend_qtagg import (
 import sympy as sp
 import numpy as np
 import matplotlib.pyplot as plt
+from functools import lru_cache
 
 from core.plugin_interface import PluginWidget
 
@@ -35,6 +36,74 @@ DARK_HOVER = "#2A2A2A"
 DARK_INPUT = "#2D2D2D"
 DARK_DANGER = "#CF6679"
 
+# Shared x-axis sample grid for plots; read-only so callers can't mutate it
+_X_GRID = np.linspace(-10.0, 10.0, 400)
+_X_GRID.setflags(write=False)
+
+# Stylesheets are static, so build them once at import
+_GROUPBOX_QSS = f"""
+    QGroupBox {{
+        background-color: {DARK_CARD};
+        color: {DARK_TEXT};
+        border: 1px solid {DARK_DIVIDER};
+        border-radius: 6px;
+        margin-top: 6px;
+    }}
+    QGroupBox:title {{
+        subcontrol-origin: margin;
+        subcontrol-position: top left;
+        padding: 0 3px;
+    }}
+"""
+
+_INPUT_QSS = f"""
+    QLineEdit, QDoubleSpinBox {{
+        background-color: {DARK_INPUT};
+        color: {DARK_TEXT};
+        border: 1px solid {DARK_DIVIDER};
+        border-radius: 4px;
+        padding: 4px;
+    }}
+"""
+
+_RESULTS_QSS = f"""
+    QTextEdit {{
+        background-color: {DARK_INPUT};
+        color: {DARK_TEXT};
+        border: 1px solid {DARK_DIVIDER};
+        border-radius: 4px;
+    }}
+"""
+
+@lru_cache(maxsize=None)
+def _button_qss(color):
+    return f"""
+        QPushButton {{
+            background-color: {color};
+            color: {DARK_TEXT};
+            border-radius: 6px;
+            padding: 6px 12px;
+        }}
+        QPushButton:hover {{
+            background-color: {DARK_HOVER};
+        }}
+    """
+
+@lru_cache(maxsize=128)
+def _parse_cached(func_str, var_str):
+    """Parse a function string once per (function, variable) pair; SymPy expressions are immutable."""
+    x = sp.symbols(var_str)
+    return sp.sympify(func_str, locals={var_str: x}), x
+
+@lru_cache(maxsize=32)
+def _lambdify_cached(expr, x):
+    """Build the NumPy callable for expr once; SymPy objects are hashable, so they key the cache directly."""
+    return sp.lambdify(x, expr, "numpy")
+
+@lru_cache(maxsize=128)
+def _latex_cached(expr):
+    """LaTeX for plot labels, rendered once per expression instead of on every redraw."""
+    return sp.latex(expr)
 
 class PluginWidget(PluginWidget):
     def __init__(self, parent=None):
@@ -146,9 +215,7 @@ class PluginWidget(PluginWidget):
         func_str = self.function_input.text().strip()
 
         try:
-            x = sp.symbols(var_str)
-            expr = sp.sympify(func_str)
-            return expr, x
+            return _parse_cached(func_str, var_str)
         except Exception as e:
             self.show_error(f"Error parsing function: {str(e)}")
             return None, None
@@ -187,15 +254,16 @@ class PluginWidget(PluginWidget):
         if expr is None: return
         try:
             self.ax.clear()
-            f = sp.lambdify(x, expr, "numpy")
-            x_vals = np.linspace(-10, 10, 400)
-            y_vals = f(x_vals)
-            self.ax.plot(x_vals, y_vals, label=f"${sp.latex(expr)}$")
+            f = _lambdify_cached(expr, x)
+            # Constant functions return a scalar, so broadcast to the grid before masking
+            y_vals = np.array(np.broadcast_to(f(_X_GRID), _X_GRID.shape), dtype=float)
+            y_vals[~np.isfinite(y_vals)] = np.nan  # Matplotlib breaks the line at NaN
+            self.ax.plot(_X_GRID, y_vals, label=f"${_latex_cached(expr)}$")
             self.ax.axhline(0, color='white', linewidth=0.5)
             self.ax.axvline(0, color='white', linewidth=0.5)
             self.ax.grid(True, linestyle='--', alpha=0.4, color="white")
             self.ax.legend()
-            self.ax.set_title(f"Plot of ${sp.latex(expr)}$", color=DARK_TEXT)
+            self.ax.set_title(f"Plot of ${_latex_cached(expr)}$", color=DARK_TEXT)
             self.canvas.draw()
         except Exception as e:
             self.show_error(f"Plotting error: {str(e)}")
@@ -227,56 +295,18 @@ class PluginWidget(PluginWidget):
 
     def make_button(self, text, color, slot):
         btn = QPushButton(text)
-        btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {color};
-                color: {DARK_TEXT};
-                border-radius: 6px;
-                padding: 6px 12px;
-            }}
-            QPushButton:hover {{
-                background-color: {DARK_HOVER};
-            }}
-        """)
+        btn.setStyleSheet(_button_qss(color))
         btn.clicked.connect(slot)
         return btn
 
     def groupbox_style(self):
-        return f"""
-            QGroupBox {{
-                background-color: {DARK_CARD};
-                color: {DARK_TEXT};
-                border: 1px solid {DARK_DIVIDER};
-                border-radius: 6px;
-                margin-top: 6px;
-            }}
-            QGroupBox:title {{
-                subcontrol-origin: margin;
-                subcontrol-position: top left;
-                padding: 0 3px;
-            }}
-        """
+        return _GROUPBOX_QSS
 
     def input_style(self):
-        return f"""
-            QLineEdit, QDoubleSpinBox {{
-                background-color: {DARK_INPUT};
-                color: {DARK_TEXT};
-                border: 1px solid {DARK_DIVIDER};
-                border-radius: 4px;
-                padding: 4px;
-            }}
-        """
+        return _INPUT_QSS
 
     def results_style(self):
-        return f"""
-            QTextEdit {{
-                background-color: {DARK_INPUT};
-                color: {DARK_TEXT};
-                border: 1px solid {DARK_DIVIDER};
-                border-radius: 4px;
-            }}
-        """
+        return _RESULTS_QSS
 
     def run(self):
         """
@@ -15,34 +15,123 @@ __plugin_author__ = "Ayden"
 __plugin_version__ = "1.0"
 __plugin_description__ = "Adds more categories and units to the Unit Converter."
 
-# Extra unit categories for testing
-EXTRA_UNITS = {
-    "Currency": {  # Fixed sample rates (manual update required)
-        "USD": 1,
-        "EUR": 0.91,
-        "GBP": 0.78,
-        "JPY": 142.12,
-        "AUD": 1.48
+from functools import lru_cache
+from types import MappingProxyType
+
+import numpy as np
+
+# Extra unit categories for testing. Every factor is the number of base units
+# (the first unit in its category) in one of that unit: 1 km² = 1_000_000 m².
+_EXTRA_UNITS_RAW = {
+    "Currency": {  # Fixed sample rates per USD (manual update required)
+        "USD": 1.0,
+        "EUR": 1 / 0.91,
+        "GBP": 1 / 0.78,
+        "JPY": 1 / 142.12,
+        "AUD": 1 / 1.48
     },
     "Data Storage": {
-        "bit": 1,
-        "KB": 1024,
-        "MB": 1024**2,
-        "GB": 1024**3,
-        "TB": 1024**4
+        "bit": 1.0,
+        "KB": 1024.0,
+        "MB": 1024.0**2,
+        "GB": 1024.0**3,
+        "TB": 1024.0**4
     },
     "Speed": {
-        "m/s": 1,
-        "km/h": 3.6,
-        "mph": 2.23694,
-        "knot": 1.94384
+        "m/s": 1.0,
+        "km/h": 1 / 3.6,
+        "mph": 1 / 2.23694,
+        "knot": 1 / 1.94384
     },
     "Area": {
-        "m²": 1,
-        "km²": 1_000_000,
+        "m²": 1.0,
+        "km²": 1_000_000.0,
         "cm²": 0.0001,
         "mm²": 0.000001,
         "ft²": 0.092903,
         "in²": 0.00064516
     }
 }
+
+# Read-only view so the Unit Converter can merge it without defensive copies
+EXTRA_UNITS = MappingProxyType({
+    category: MappingProxyType(units) for category, units in _EXTRA_UNITS_RAW.items()
+})
+
+# Flat factor table for the converter's hot path: one dict lookup per unit,
+# then plain float64 arithmetic. Keys are "Category/unit", e.g. "Speed/km/h".
+_FACTOR_INDEX = {}
+_factors = []
+_category_codes = []
+for _code, (_category, _units) in enumerate(EXTRA_UNITS.items()):
+    for _unit, _factor in _units.items():
+        _FACTOR_INDEX[f"{_category}/{_unit}"] = len(_factors)
+        _factors.append(_factor)
+        _category_codes.append(_code)
+
+_FACTORS = np.array(_factors, dtype=np.float64)
+_CATEGORY_CODES = np.array(_category_codes, dtype=np.int16)
+_FACTORS.setflags(write=False)
+_CATEGORY_CODES.setflags(write=False)
+del _code, _category, _units, _unit, _factor, _factors, _category_codes
+
+
+def _convert_py(v, i_src, i_dst, factors):
+    return v * factors[i_src] / factors[i_dst]
+
+
+def _convert_array_py(values, i_src, i_dst, factors):
+    return values * (factors[i_src] / factors[i_dst])
+
+
+@lru_cache(maxsize=1)
+def _kernels():
+    """Return (scalar, array) conversion kernels, JIT-compiling them with Numba on first use.
+
+    Numba is optional and slow to import, so it is only loaded once a conversion is
+    requested; merging EXTRA_UNITS never pays for it.
+    """
+    try:
+        import numba
+    except ImportError:
+        return _convert_py, _convert_array_py
+
+    factors_t = numba.types.Array(numba.float64, 1, "C", readonly=True)
+
+    @numba.njit(numba.float64(numba.float64, numba.int64, numba.int64, factors_t), cache=True)
+    def convert_kernel(v, i_src, i_dst, factors):
+        return v * factors[i_src] / factors[i_dst]
+
+    @numba.njit(numba.float64[:](numba.float64[:], numba.int64, numba.int64, factors_t),
+                parallel=True, cache=True)
+    def convert_array_kernel(values, i_src, i_dst, factors):
+        scale = factors[i_src] / factors[i_dst]
+        out = np.empty_like(values)
+        for i in numba.prange(values.shape[0]):
+            out[i] = values[i] * scale
+        return out
+
+    return convert_kernel, convert_array_kernel
+
+
+def _unit_ids(src, dst):
+    i_src = _FACTOR_INDEX[src]
+    i_dst = _FACTOR_INDEX[dst]
+    if _CATEGORY_CODES[i_src] != _CATEGORY_CODES[i_dst]:
+        raise ValueError(f"Cannot convert {src} to {dst}: units are in different categories")
+    return i_src, i_dst
+
+
+def convert(value, src, dst):
+    """Convert a single value from unit `src` to unit `dst` ("Category/unit" keys)."""
+    i_src, i_dst = _unit_ids(src, dst)
+    return _kernels()[0](float(value), i_src, i_dst, _FACTORS)
+
+
+def convert_batch(values, src, dst):
+    """Convert an array of values from unit `src` to unit `dst` ("Category/unit" keys)."""
+    i_src, i_dst = _unit_ids(src, dst)
+    arr = np.asarray(values, dtype=np.float64)
+    if arr.ndim == 1 and arr.flags.writeable:
+        return _kernels()[1](arr, i_src, i_dst, _FACTORS)
+    return arr * (_FACTORS[i_src] / _FACTORS[i_dst])